@@ -1,8 +1,35 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
-from typing import List, Dict
+from typing import Callable, List, Dict, Type
 import psycopg2
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+import csv
+import io
+import logging
+import multiprocessing
 import os
+import threading
+from ai_helper import AIHelper
+
+logger = logging.getLogger(__name__)
+
+# One connection pool per distinct db_config, shared by every processor
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+# Serializes add_to_database across processors running in parallel threads
+_WRITE_LOCK = threading.Lock()
+
+
+def _get_pool(db_config: dict) -> ThreadedConnectionPool:
+    """Return the connection pool for db_config, creating it on first use."""
+    key = tuple(sorted(db_config.items()))
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = ThreadedConnectionPool(1, 8, **db_config)
+        return _POOLS[key]
+
 
 class AddTransactions(ABC):
     """
@@ -23,48 +50,65 @@ class AddTransactions(ABC):
         self.person = person
         self.df = None
         self.processed_files = []
-        self._category_cache = {}
+        # Categories are loaded from the database on first use (see _category_cache)
+        self._categories = None
         self._person_cache = {}
         self._account_type_cache = {}
-        
-        # Load categories immediately during initialization
-        self._load_categories_only()
+        # AIHelper is a process-wide singleton, shared by every processor
+        self.ai_helper = AIHelper()
+
+    @property
+    def _category_cache(self) -> dict:
+        """Lowercase category name -> ID, loaded on first access."""
+        if self._categories is None:
+            self._load_categories_only()
+        return self._categories
+
+    @_category_cache.setter
+    def _category_cache(self, categories: dict) -> None:
+        self._categories = categories
 
     def _load_reference_data(self, conn: psycopg2.extensions.connection) -> None:
         """
         Load reference data from the database into cache.
         """
         cursor = conn.cursor()
-        
-        # Load categories
-        cursor.execute("SELECT id, category_name FROM budget_app.spending_categories")
-        self._category_cache = {name.lower(): id for id, name in cursor.fetchall()}
-        
-        # Load persons
-        cursor.execute("SELECT id, name FROM budget_app.persons")
-        self._person_cache = {name.lower(): id for id, name in cursor.fetchall()}
-        
-        # Load account types
-        cursor.execute("SELECT id, card_type FROM budget_app.account_type")
-        self._account_type_cache = {name.lower(): id for id, name in cursor.fetchall()}
+
+        # Categories, persons and account types in one round-trip, tagged by table
+        cursor.execute("""
+            SELECT 'c', id, category_name FROM budget_app.spending_categories
+            UNION ALL
+            SELECT 'p', id, name FROM budget_app.persons
+            UNION ALL
+            SELECT 'a', id, card_type FROM budget_app.account_type
+        """)
+        caches = {'c': {}, 'p': {}, 'a': {}}
+        for kind, id, name in cursor.fetchall():
+            caches[kind][name.lower()] = id
+
+        self._category_cache = caches['c']
+        self._person_cache = caches['p']
+        self._account_type_cache = caches['a']
 
     def _load_categories_only(self) -> None:
         """
-        Load only categories from the database during initialization.
+        Load only categories from the database on first use of _category_cache.
         Categories are read-only and cannot be updated or deleted.
         """
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-            
-            # Load categories only
-            cursor.execute("SELECT id, category_name FROM budget_app.spending_categories")
-            self._category_cache = {name.lower(): id for id, name in cursor.fetchall()}
-            
-            cursor.close()
-            conn.close()
+            conn = self.create_connection()
+            try:
+                cursor = conn.cursor()
+
+                # Load categories only
+                cursor.execute("SELECT id, category_name FROM budget_app.spending_categories")
+                self._category_cache = {name.lower(): id for id, name in cursor.fetchall()}
+
+                cursor.close()
+            finally:
+                self.release_connection(conn)
         except Exception as e:
-            print(f"Warning: Could not load categories during initialization: {e}")
+            logger.warning("Could not load categories: %s", e)
             self._category_cache = {}
 
     def _get_category(self, category: str) -> int:
@@ -74,48 +118,107 @@ class AddTransactions(ABC):
             raise ValueError(f"Category '{category}' does not exist in database. Categories are read-only.")
         return self._category_cache[category_lower]
 
-    def _get_or_create_person(self, conn: psycopg2.extensions.connection, person: str) -> int:
-        """Get person ID, create if not exists."""
-        person_lower = person.lower()
-        if person_lower not in self._person_cache:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO budget_app.persons (name) VALUES (%s) RETURNING id",
-                (person,)
+    def _resolve_refs(self, conn: psycopg2.extensions.connection, transactions: List[Dict]) -> None:
+        """
+        Create every person and account type referenced by the batch that is not
+        cached yet, one round-trip per table, and add the new IDs to the caches.
+        """
+        cursor = conn.cursor()
+
+        # Unseen names, de-duplicated case-insensitively (first spelling wins)
+        new_persons = {}
+        new_account_types = {}
+        for transaction in transactions:
+            person_lower = transaction['person'].lower()
+            if person_lower not in self._person_cache:
+                new_persons.setdefault(person_lower, transaction['person'])
+            account_type_lower = transaction['account_type'].lower()
+            if account_type_lower not in self._account_type_cache:
+                new_account_types.setdefault(account_type_lower, transaction['account_type'])
+
+        if new_persons:
+            rows = execute_values(
+                cursor,
+                "INSERT INTO budget_app.persons (name) VALUES %s RETURNING id, name",
+                [(name,) for name in new_persons.values()],
+                fetch=True
             )
-            self._person_cache[person_lower] = cursor.fetchone()[0]
-        return self._person_cache[person_lower]
-
-    def _get_or_create_account_type(self, conn: psycopg2.extensions.connection, account_type: str) -> int:
-        """Get account type ID, create if not exists."""
-        account_type_lower = account_type.lower()
-        if account_type_lower not in self._account_type_cache:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO budget_app.account_type (card_type) VALUES (%s) RETURNING id",
-                (account_type,)
+            self._person_cache.update({name.lower(): id for id, name in rows})
+
+        if new_account_types:
+            # DO UPDATE (rather than DO NOTHING) so conflicting rows are RETURNed too
+            rows = execute_values(
+                cursor,
+                """
+                INSERT INTO budget_app.account_type (card_type) VALUES %s
+                ON CONFLICT (card_type) DO UPDATE SET card_type = EXCLUDED.card_type
+                RETURNING id, card_type
+                """,
+                [(name,) for name in new_account_types.values()],
+                fetch=True
             )
-            self._account_type_cache[account_type_lower] = cursor.fetchone()[0]
-        return self._account_type_cache[account_type_lower]
+            self._account_type_cache.update({name.lower(): id for id, name in rows})
 
     @abstractmethod
     def read_files(self, file_paths: List[str]) -> pd.DataFrame:
         """Read transaction files and convert them to a pandas DataFrame."""
         pass
 
+    def _read_files_parallel(self, file_paths: List[str], read_file: Callable[[str], pd.DataFrame],
+                             executor_class: Type[Executor] = ThreadPoolExecutor) -> List[pd.DataFrame]:
+        """
+        Read files concurrently with read_file, keeping the input order.
+        Files that fail to read are reported and removed from processed_files
+        so they are not deleted.
+
+        Args:
+            file_paths (List[str]): Paths of the files to read
+            read_file (Callable[[str], pd.DataFrame]): Reads a single file; must be a
+                module-level function when executor_class is ProcessPoolExecutor
+            executor_class (Type[Executor]): Threads for I/O-bound readers, processes
+                for CPU-bound ones such as PDF parsing
+
+        Returns:
+            List[pd.DataFrame]: One DataFrame per successfully read file
+        """
+        # Snapshot: processed_files may be the same list object as file_paths
+        file_paths = list(file_paths)
+        if not file_paths:
+            return []
+        executor_kwargs = {'max_workers': min(8, len(file_paths))}
+        if issubclass(executor_class, ProcessPoolExecutor):
+            # main.py runs processors on threads; forking a multi-threaded process
+            # can copy a held lock into the child, so workers start from a fresh interpreter
+            executor_kwargs['mp_context'] = multiprocessing.get_context('spawn')
+        with executor_class(**executor_kwargs) as executor:
+            futures = [executor.submit(read_file, file_path) for file_path in file_paths]
+
+        dataframes = []
+        for file_path, future in zip(file_paths, futures):
+            try:
+                dataframes.append(future.result())
+            except Exception as e:
+                logger.error("Error reading file %s: %s", file_path, e)
+                if file_path in self.processed_files:
+                    self.processed_files.remove(file_path)
+        return dataframes
+
     @abstractmethod
     def clean_data(self) -> pd.DataFrame:
         """Clean and standardize the transaction data."""
         pass
 
     def create_connection(self) -> psycopg2.extensions.connection:
-        """Create a connection to the PostgreSQL database."""
+        """Borrow a connection to the PostgreSQL database from the shared pool."""
         try:
-            conn = psycopg2.connect(**self.db_config)
-            return conn
+            return _get_pool(self.db_config).getconn()
         except psycopg2.Error as e:
             raise Exception(f"Database connection error: {str(e)}")
 
+    def release_connection(self, conn: psycopg2.extensions.connection) -> None:
+        """Return a connection obtained from create_connection to the pool."""
+        _get_pool(self.db_config).putconn(conn)
+
     def prepare_data_for_db(self) -> List[Dict]:
         """
         Convert the cleaned DataFrame into a format suitable for database insertion.
@@ -126,38 +229,29 @@ class AddTransactions(ABC):
         if self.df is None:
             raise ValueError("No data to prepare. Call clean_data first.")
 
-        transactions = []
-        for _, row in self.df.iterrows():
-            # Handle transaction_date formatting - ensure consistent YYYY-MM-DD HH:MM:SS format
-            transaction_date = row['transaction_date']
-            if hasattr(transaction_date, 'strftime'):
-                # If it's already a datetime object, format it
-                transaction_date = transaction_date.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                # If it's a string, try to parse it first
-                try:
-                    parsed_date = pd.to_datetime(transaction_date)
-                    transaction_date = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-                except Exception:
-                    # If parsing fails, keep original value and let database handle it
-                    pass
-            
-            # Handle amount formatting
-            amount = row['amount']
-            if not isinstance(amount, (int, float)):
-                amount = float(amount)
-            
-            transaction = {
-                'transaction_date': transaction_date,
-                'amount': amount,
-                'merchant_name': row['merchant_name'],
-                'category': row['category'],
-                'person': self.person,
-                'account_type': self.account_type
-            }
-            transactions.append(transaction)
-
-        return transactions
+        # Format transaction_date as YYYY-MM-DD HH:MM:SS for the whole column at once
+        dates = self.df['transaction_date']
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            dates = dates.dt.strftime('%Y-%m-%d %H:%M:%S')
+        else:
+            # Strings: parse what we can and keep the rest for the database to handle
+            parsed = pd.to_datetime(dates, errors='coerce', format='mixed')
+            dates = parsed.dt.strftime('%Y-%m-%d %H:%M:%S').where(parsed.notna(), dates)
+
+        transactions = self.df[['merchant_name', 'category']].assign(
+            transaction_date=dates,
+            amount=self.df['amount'].astype(float),
+            person=self.person,
+            account_type=self.account_type
+        )
+        return transactions[[
+            'transaction_date',
+            'amount',
+            'merchant_name',
+            'category',
+            'person',
+            'account_type'
+        ]].to_dict(orient='records')
 
     def add_to_database(self, transactions: List[Dict]) -> bool:
         """
@@ -169,56 +263,130 @@ class AddTransactions(ABC):
         Returns:
             bool: True if transactions were successfully added, False otherwise
         """
-        conn = self.create_connection()
-        try:
-            # Load reference data
-            self._load_reference_data(conn)
-            
-            cursor = conn.cursor()
-            
-            # Process each transaction
-            for transaction in transactions:
-                # Get or create reference IDs
-                category_id = self._get_category(transaction['category'])
-                person_id = self._get_or_create_person(conn, transaction['person'])
-                account_type_id = self._get_or_create_account_type(conn, transaction['account_type'])
-                
-                # Insert the transaction
-                cursor.execute("""
-                    INSERT INTO budget_app.transactions (
-                        amount,
-                        merchant_name,
-                        category_id,
-                        person_id,
-                        transaction_date,
-                        account_type_id
-                    ) VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT ON CONSTRAINT unique_transaction DO NOTHING
-                """, (
-                    transaction['amount'],
-                    transaction['merchant_name'],
-                    category_id,
-                    person_id,
-                    transaction['transaction_date'],
-                    account_type_id
-                ))
-            
-            conn.commit()
-            return True
-        except psycopg2.Error as e:
-            conn.rollback()
-            raise Exception(f"Database insertion error: {str(e)}")
-        finally:
-            conn.close()
+        # Writers run one at a time: concurrent processors must not both create the same
+        # new person, which has no unique constraint to fall back on
+        with _WRITE_LOCK:
+            conn = self.create_connection()
+            try:
+                # Load reference data
+                self._load_reference_data(conn)
+
+                # Resolve all reference IDs up front so the load itself is a single COPY
+                self._resolve_refs(conn, transactions)
+                category_ids = {
+                    name: self._get_category(name)
+                    for name in {transaction['category'] for transaction in transactions}
+                }
+                person_ids = {
+                    name: self._person_cache[name.lower()]
+                    for name in {transaction['person'] for transaction in transactions}
+                }
+                account_type_ids = {
+                    name: self._account_type_cache[name.lower()]
+                    for name in {transaction['account_type'] for transaction in transactions}
+                }
+                rows = [
+                    (
+                        transaction['amount'],
+                        transaction['merchant_name'],
+                        category_ids[transaction['category']],
+                        person_ids[transaction['person']],
+                        transaction['transaction_date'],
+                        account_type_ids[transaction['account_type']]
+                    )
+                    for transaction in transactions
+                ]
+
+                self._bulk_copy(conn, rows)
+
+                conn.commit()
+                return True
+            except psycopg2.Error as e:
+                conn.rollback()
+                raise Exception(f"Database insertion error: {str(e)}")
+            finally:
+                self.release_connection(conn)
+
+    def _bulk_copy(self, conn: psycopg2.extensions.connection, rows: List[tuple]) -> None:
+        """
+        Stream rows into a temporary staging table with COPY, then move them into
+        budget_app.transactions, skipping rows that violate unique_transaction.
+
+        Args:
+            conn: Open database connection (the caller commits)
+            rows (List[tuple]): (amount, merchant_name, category_id, person_id,
+                transaction_date, account_type_id) tuples
+        """
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        buf.seek(0)
+
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TEMP TABLE tx_stage
+            (LIKE budget_app.transactions INCLUDING DEFAULTS)
+            ON COMMIT DROP
+        """)
+        cursor.copy_expert("""
+            COPY tx_stage (
+                amount,
+                merchant_name,
+                category_id,
+                person_id,
+                transaction_date,
+                account_type_id
+            ) FROM STDIN WITH CSV
+        """, buf)
+        cursor.execute("""
+            INSERT INTO budget_app.transactions (
+                amount,
+                merchant_name,
+                category_id,
+                person_id,
+                transaction_date,
+                account_type_id
+            )
+            SELECT amount, merchant_name, category_id, person_id, transaction_date, account_type_id
+            FROM tx_stage
+            ON CONFLICT ON CONSTRAINT unique_transaction DO NOTHING
+        """)
+
+    @staticmethod
+    def _dedupe_transactions(transactions: List[Dict]) -> List[Dict]:
+        """
+        Drop transactions that repeat an earlier one on the unique_transaction key
+        (amount, merchant_name, person, transaction_date), keeping the first.
+        The database would discard them anyway; this keeps them out of the load.
+        """
+        seen = set()
+        unique = []
+        for transaction in transactions:
+            key = (
+                transaction['amount'],
+                transaction['merchant_name'],
+                transaction['person'].lower(),
+                transaction['transaction_date']
+            )
+            if key not in seen:
+                seen.add(key)
+                unique.append(transaction)
+        return unique
 
     def delete_processed_files(self) -> None:
         """Delete the successfully processed files."""
-        for file_path in self.processed_files:
-            try:
-                os.remove(file_path)
-                print(f"Deleted processed file: {file_path}")
-            except OSError as e:
-                print(f"Error deleting file {file_path}: {str(e)}")
+        if not self.processed_files:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(self.processed_files))) as executor:
+            list(executor.map(self._safe_remove, self.processed_files))
+
+    @staticmethod
+    def _safe_remove(file_path: str) -> None:
+        """Delete one file, logging instead of raising on failure."""
+        try:
+            os.remove(file_path)
+            logger.info("Deleted processed file: %s", file_path)
+        except OSError as e:
+            logger.error("Error deleting file %s: %s", file_path, e)
 
     def process_transactions(self, file_paths: List[str]) -> None:
         """Main method to orchestrate the entire process."""
@@ -232,21 +400,22 @@ class AddTransactions(ABC):
 
             # Prepare data for database insertion
             transactions = self.prepare_data_for_db()
+            transactions = self._dedupe_transactions(transactions)
 
             # Add to database and get the count of successfully added transactions
             if transactions:
                 if self.add_to_database(transactions):
                     # Only delete files if transactions were successfully added to the database
                     self.delete_processed_files()
-                    print(f"Successfully processed {len(transactions)} transactions and deleted source files")
+                    logger.info("Successfully processed %d transactions and deleted source files", len(transactions))
                 else:
-                    print("No transactions were added to the database.")
+                    logger.info("No transactions were added to the database.")
             else:
-                print("No transactions to add after cleaning.")
+                logger.info("No transactions to add after cleaning.")
 
         except Exception as e:
-            print(f"Transaction processing failed: {str(e)}")
-            print("Files were NOT deleted due to error. Please review and retry.")
+            logger.error("Transaction processing failed: %s", e)
+            logger.error("Files were NOT deleted due to error. Please review and retry.")
 
     def get_categories_from_db(self) -> List[str]:
         """
@@ -255,13 +424,15 @@ class AddTransactions(ABC):
             List[str]: List of category names
         """
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-            cursor.execute("SELECT category_name FROM budget_app.spending_categories")
-            categories = [row[0] for row in cursor.fetchall()]
-            cursor.close()
-            conn.close()
+            conn = self.create_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT category_name FROM budget_app.spending_categories")
+                categories = [row[0] for row in cursor.fetchall()]
+                cursor.close()
+            finally:
+                self.release_connection(conn)
             return categories
         except Exception as e:
-            print(f"Failed to fetch categories from DB: {e}")
+            logger.error("Failed to fetch categories from DB: %s", e)
             return []
@@ -1,16 +1,34 @@
 from langchain_core.messages import HumanMessage, SystemMessage
+import atexit
+import json
 import os
+import re
+import threading
 import pandas as pd
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from vendor_mapping import get_category_from_vendor
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Store numbers, punctuation and underscores are dropped from merchant cache keys,
+# so "STARBUCKS #1234" and "Starbucks 5678" share one cached category
+_MERCHANT_NOISE_RE = re.compile(r'[\W\d_]+')
+
+
+def _normalize_merchant(merchant_name: str) -> str:
+    """Return the cache key for a merchant name."""
+    return _MERCHANT_NOISE_RE.sub(' ', merchant_name.lower()).strip()
+
+
 class AIHelper:
     _instance = None
 
+    # Merchants classified per LLM request in guess_categories_batch
+    BATCH_SIZE = 50
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -25,6 +43,18 @@ class AIHelper:
         # AI_PROVIDER selects the backend: "ollama" (local) or "openai" (cloud)
         self.provider = os.getenv('AI_PROVIDER', 'ollama').lower()
         self.llm = None
+        # Normalized merchant name -> category returned by the LLM, persisted across runs
+        self._cache_path = os.path.expanduser(
+            os.getenv('AI_CACHE_PATH', '~/.cache/pfh/merchant_categories.json')
+        )
+        self._merchant_cache = self._load_merchant_cache()
+        self._cache_dirty = False
+        self._cache_lock = threading.Lock()
+        # Concurrent LLM requests across all callers of this singleton; keep under
+        # the provider's rate limit. Every llm.invoke holds one of the slots.
+        self.max_workers = max(1, int(os.getenv('AI_MAX_WORKERS', '4')))
+        self._llm_slots = threading.BoundedSemaphore(self.max_workers)
+        atexit.register(self.save_merchant_cache)
 
         if self.provider == 'openai':
             self._init_openai()
@@ -33,6 +63,33 @@ class AIHelper:
         else:
             print(f"Unknown AI_PROVIDER '{self.provider}'. Expected 'openai' or 'ollama'. AI features disabled.")
 
+    def _load_merchant_cache(self) -> Dict[str, str]:
+        """Load the persisted merchant cache, starting empty if it is missing or unreadable."""
+        try:
+            with open(self._cache_path) as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Could not read merchant category cache {self._cache_path}: {e}")
+            return {}
+
+    def save_merchant_cache(self) -> None:
+        """Write the merchant cache to disk if it changed since the last save."""
+        with self._cache_lock:
+            if not self._cache_dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+                tmp_path = f"{self._cache_path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(self._merchant_cache, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self._cache_path)
+                self._cache_dirty = False
+            except Exception as e:
+                print(f"Could not write merchant category cache {self._cache_path}: {e}")
+
     def _init_openai(self):
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
@@ -61,9 +118,12 @@ class AIHelper:
         except Exception as e:
             print(f"Failed to initialize Ollama ({model} @ {base_url}): {e}")
 
-    def guess_category_openai(self, merchant_name: str, categories: List[str]) -> str:
+    def guess_category_openai(self, merchant_name: str, categories: List[str], use_cache: bool = True) -> str:
         if not self.llm or not categories:
             return "Other"
+        cached = self._cached_category(merchant_name, categories) if use_cache else None
+        if cached:
+            return cached
         categories_str = ", ".join(categories)
         prompt = (
             f"Classify the following merchant into one of these spending categories: {categories_str}.\n"
@@ -76,19 +136,131 @@ class AIHelper:
                 SystemMessage(content="You are a helpful assistant that classifies merchants into spending categories."),
                 HumanMessage(content=prompt)
             ]
-            response = self.llm.invoke(messages)
+            with self._llm_slots:
+                response = self.llm.invoke(messages)
             category = response.content.strip()
             #print(f"DEBUG - AI Response: {category}")
-            # Match case-insensitively and return the canonical category name,
-            # so a reply like "utilities" still maps to "Utilities".
-            for valid in categories:
-                if category.lower() == valid.lower():
-                    return valid
-            return "Other"
+            category = self._match_category(category, categories)
+            if category:
+                self._remember_category(merchant_name, category)
+            return category or "Other"
         except Exception as e:
             print(f"AI category guess ({self.provider}) failed for merchant '{merchant_name}': {e}")
             return "Other"
 
+    @staticmethod
+    def _match_category(reply: str, categories: List[str]) -> Optional[str]:
+        """
+        Match a model reply case-insensitively and return the canonical category name,
+        so a reply like "utilities" still maps to "Utilities".
+        """
+        reply = reply.strip().lower()
+        for valid in categories:
+            if reply == valid.lower():
+                return valid
+        return None
+
+    def _cached_category(self, merchant_name: str, categories: List[str]) -> Optional[str]:
+        """Return the cached category for a merchant if it is still one of the allowed categories."""
+        cached = self._merchant_cache.get(_normalize_merchant(merchant_name))
+        # "Other" is a fallback, not an answer; caches written before it was skipped may hold it
+        if not cached or cached.lower() == 'other':
+            return None
+        return self._match_category(cached, categories)
+
+    def _remember_category(self, merchant_name: str, category: str) -> None:
+        """
+        Cache a successful classification under the normalized merchant name.
+        "Other" is never cached, so re-categorizing "Other" transactions asks the model
+        again; it drops any earlier answer for the merchant instead.
+        """
+        key = _normalize_merchant(merchant_name)
+        with self._cache_lock:
+            if not key:
+                return
+            if category.lower() == 'other':
+                if self._merchant_cache.pop(key, None) is not None:
+                    self._cache_dirty = True
+            elif self._merchant_cache.get(key) != category:
+                self._merchant_cache[key] = category
+                self._cache_dirty = True
+
+    def guess_categories_batch(self, merchant_names: List[str], categories: List[str],
+                               use_cache: bool = True) -> Dict[str, str]:
+        """
+        Classify many merchants with one LLM request per BATCH_SIZE merchants,
+        running them concurrently within the max_workers cap.
+
+        Args:
+            merchant_names (List[str]): Distinct merchant names to classify
+            categories (List[str]): Allowed category names
+            use_cache (bool): Look merchants up in the merchant cache first; with False
+                every merchant is sent to the model, and fresh answers are still cached
+
+        Returns:
+            Dict[str, str]: Category for every merchant, "Other" when it could not be classified
+                or the name is missing
+        """
+        results = {merchant: "Other" for merchant in merchant_names}
+        if not self.llm or not categories:
+            return results
+
+        # Only merchants without a cached category go to the LLM; missing names
+        # (NaN from a blank CSV cell) have nothing to classify and stay "Other"
+        misses = []
+        for merchant in merchant_names:
+            if not isinstance(merchant, str) or not merchant.strip():
+                continue
+            cached = self._cached_category(merchant, categories) if use_cache else None
+            if cached:
+                results[merchant] = cached
+            else:
+                misses.append(merchant)
+
+        batches = [misses[start:start + self.BATCH_SIZE] for start in range(0, len(misses), self.BATCH_SIZE)]
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                for batch_results in executor.map(lambda batch: self._guess_batch(batch, categories, use_cache), batches):
+                    results.update(batch_results)
+        self.save_merchant_cache()
+        return results
+
+    def _guess_batch(self, merchant_names: List[str], categories: List[str], use_cache: bool = True) -> Dict[str, str]:
+        """Classify one batch; merchants missing from the reply fall back to single guesses."""
+        categories_str = ", ".join(categories)
+        prompt = (
+            f"Classify each of the following merchants into one of these spending categories: {categories_str}.\n"
+            f"Respond with ONLY a JSON object that maps every merchant name, exactly as given, to one of the exact category names listed above. Do not add any explanation or additional text.\n"
+            f"Merchants: {json.dumps(merchant_names)}\n"
+        )
+        replies = {}
+        try:
+            messages = [
+                SystemMessage(content="You are a helpful assistant that classifies merchants into spending categories."),
+                HumanMessage(content=prompt)
+            ]
+            with self._llm_slots:
+                response = self.llm.invoke(messages)
+            content = response.content
+            # Tolerate code fences or stray text around the JSON object
+            replies = json.loads(content[content.index('{'):content.rindex('}') + 1])
+            if not isinstance(replies, dict):
+                raise ValueError("reply is not a JSON object")
+        except Exception as e:
+            print(f"AI batch category guess ({self.provider}) failed for {len(merchant_names)} merchants: {e}")
+            replies = {}
+
+        results = {}
+        for merchant in merchant_names:
+            reply = replies.get(merchant)
+            category = self._match_category(reply, categories) if isinstance(reply, str) else None
+            if category:
+                self._remember_category(merchant, category)
+                results[merchant] = category
+            else:
+                results[merchant] = self.guess_category_openai(merchant, categories, use_cache)
+        return results
+
     def add_category(self, df: pd.DataFrame, category_cache: dict) -> pd.DataFrame:
         """
         Add categories to transactions using vendor mapping first, then rule-based logic, and finally AI categorization.
@@ -104,22 +276,21 @@ class AIHelper:
         if 'category' not in df.columns:
             df['category'] = 'Other'
 
-        # First, check vendor mapping for known vendors
-        df['category'] = df.apply(
-            lambda row: get_category_from_vendor(row['merchant_name']) or row['category'],
-            axis=1
-        )
+        # First, check vendor mapping for known vendors (once per distinct merchant)
+        vendor_categories = {
+            merchant: get_category_from_vendor(merchant)
+            for merchant in df['merchant_name'].unique()
+        }
+        df['category'] = df['merchant_name'].map(vendor_categories).fillna(df['category'])
 
         # Use AI to categorize transactions with 'Other' category
         other_mask = df['category'] == 'Other'
         if other_mask.any():
-            other_transactions = df[other_mask]
-            for idx, row in other_transactions.iterrows():
-                ai_category = self.guess_category_openai(
-                    row['merchant_name'],
-                    list(category_cache.keys())
-                )
-                if ai_category != 'Other':
-                    df.loc[idx, 'category'] = ai_category
+            other_merchants = df.loc[other_mask, 'merchant_name']
+            ai_categories = self.guess_categories_batch(
+                other_merchants.unique().tolist(),
+                list(category_cache.keys())
+            )
+            df.loc[other_mask, 'category'] = other_merchants.map(ai_categories)
 
         return df
@@ -1,7 +1,6 @@
 from add_transactions import AddTransactions
 import pandas as pd
 from typing import List
-from ai_helper import AIHelper
 
 class AmexTransactions(AddTransactions):
     """
@@ -18,7 +17,6 @@ class AmexTransactions(AddTransactions):
         """
         super().__init__(db_config, person)
         self.account_type = 'Amex Card'
-        self.ai_helper = AIHelper()
 
     def read_files(self, file_paths: List[str]) -> pd.DataFrame:
         """
@@ -28,21 +26,22 @@ class AmexTransactions(AddTransactions):
         Returns:
             pd.DataFrame: Combined DataFrame of all transactions
         """
-        dataframes = []
-        for file_path in file_paths:
-            try:
-                df = pd.read_csv(file_path)
-                df["person"] = self.person
-                dataframes.append(df)
-            except Exception as e:
-                print(f"Error reading file {file_path}: {str(e)}")
-                if file_path in self.processed_files:
-                    self.processed_files.remove(file_path)
+        dataframes = self._read_files_parallel(file_paths, self._read_file)
         if not dataframes:
             raise ValueError("No valid files were read")
         self.df = pd.concat(dataframes, ignore_index=True)
         return self.df
 
+    def _read_file(self, file_path: str) -> pd.DataFrame:
+        """Read a single Amex Card CSV file, parsing only the columns clean_data uses."""
+        return pd.read_csv(
+            file_path,
+            usecols=['Date', 'Description', 'Amount'],
+            dtype={'Description': str, 'Amount': 'float64'},
+            parse_dates=['Date'],
+            date_format='%m/%d/%Y'
+        )
+
     def clean_data(self) -> pd.DataFrame:
         """
         Clean and standardize the Amex Card transaction data.
@@ -56,31 +55,15 @@ class AmexTransactions(AddTransactions):
         if self.df is None:
             raise ValueError("No data to clean. Call read_files first.")
         
-        # Rename columns to standard format
-        self.df = self.df.rename(columns={
-            'Date': 'transaction_date',
-            'Description': 'merchant_name',
-            'Amount': 'amount',
-            'Card Member,': 'person'
+        # Build the standard columns in one step: rename, convert and select
+        self.df = pd.DataFrame({
+            'transaction_date': pd.to_datetime(self.df['Date'], format='%m/%d/%Y'),
+            'amount': self.df['Amount'],  # read as float64
+            'merchant_name': self.df['Description']
         })
 
-
-        # Convert date string to datetime with standard format
-        self.df['transaction_date'] = pd.to_datetime(self.df['transaction_date'], format='%m/%d/%Y')
-
-        # Ensure amount is numeric and handle credits/debits
-        self.df['amount'] = pd.to_numeric(self.df['amount'])
-
-        # Add categories using AI helper
+        # Add categories using AI helper (appended as the last column)
         self.df = self.ai_helper.add_category(self.df, self._category_cache)
 
-        # Select and reorder columns
-        self.df = self.df[[
-            'transaction_date',
-            'amount',
-            'merchant_name',
-            'category'
-        ]]
-
         return self.df
 
@@ -1,7 +1,6 @@
 from add_transactions import AddTransactions
 import pandas as pd
 from typing import List
-from ai_helper import AIHelper
 
 class AppleTransactions(AddTransactions):
     """
@@ -19,7 +18,6 @@ class AppleTransactions(AddTransactions):
         """
         super().__init__(db_config, person)
         self.account_type = 'Apple Card'
-        self.ai_helper = AIHelper()
 
     def read_files(self, file_paths: List[str]) -> pd.DataFrame:
         """
@@ -31,22 +29,24 @@ class AppleTransactions(AddTransactions):
         Returns:
             pd.DataFrame: Combined DataFrame of all transactions
         """
-        dataframes = []
-        for file_path in file_paths:
-            try:
-                df = pd.read_csv(file_path)
-                dataframes.append(df)
-            except Exception as e:
-                print(f"Error reading file {file_path}: {str(e)}")
-                # Remove failed file from processed_files list
-                self.processed_files.remove(file_path)
-        
+        dataframes = self._read_files_parallel(file_paths, self._read_file)
+
         if not dataframes:
             raise ValueError("No valid files were read")
         
         self.df = pd.concat(dataframes, ignore_index=True)
         return self.df
 
+    def _read_file(self, file_path: str) -> pd.DataFrame:
+        """Read a single Apple Card CSV file, parsing only the columns clean_data uses."""
+        return pd.read_csv(
+            file_path,
+            usecols=['Transaction Date', 'Merchant', 'Amount (USD)', 'Purchased By', 'Category'],
+            dtype={'Merchant': str, 'Purchased By': str, 'Category': str},
+            parse_dates=['Transaction Date'],
+            date_format='%m/%d/%Y'
+        )
+
     def clean_data(self) -> pd.DataFrame:
         """
         Clean and standardize the Apple Card transaction data.
@@ -61,49 +61,40 @@ class AppleTransactions(AddTransactions):
         if self.df is None:
             raise ValueError("No data to clean. Call read_files first.")
 
-        # Rename columns to standard format
-        self.df = self.df.rename(columns={
-            'Transaction Date': 'transaction_date',
-            'Merchant': 'merchant_name',
-            'Amount (USD)': 'amount',
-            'Purchased By': 'person',
-            'Category': 'category'
-        })
-
-        # Convert date string to datetime with standard format
-        self.df['transaction_date'] = pd.to_datetime(self.df['transaction_date'], format='%m/%d/%Y')
-
         # Ensure amount is numeric and handle credits/debits
         # First check if amount is already numeric
-        if not pd.api.types.is_numeric_dtype(self.df['amount']):
-            # Remove $ and , only if amount is string type
-            if pd.api.types.is_string_dtype(self.df['amount']):
-                self.df['amount'] = self.df['amount'].str.replace('$', '').str.replace(',', '')
-            self.df['amount'] = pd.to_numeric(self.df['amount'])
-        
+        amount = self.df['Amount (USD)']
+        if not pd.api.types.is_numeric_dtype(amount):
+            # Remove $ and , in one pass, only if amount is string type
+            if pd.api.types.is_string_dtype(amount):
+                amount = amount.str.replace(r'[$,]', '', regex=True)
+            amount = pd.to_numeric(amount)
+
+        # Build the standard columns in one step: rename, convert and select
+        self.df = pd.DataFrame({
+            'transaction_date': pd.to_datetime(self.df['Transaction Date'], format='%m/%d/%Y'),
+            'amount': amount,
+            'merchant_name': self.df['Merchant'],
+            'category': self.df['Category'],
+            'person': self.df['Purchased By']
+        })
+
         # Add categories using AI helper
         self.df = self.ai_helper.add_category(self.df, self._category_cache)
 
         # Use AI to categorize transactions with categories not in database
-        invalid_category_mask = ~self.df['category'].isin(self._category_cache.keys())
+        valid_categories = list(self._category_cache)
+        invalid_category_mask = ~self.df['category'].isin(valid_categories)
         if invalid_category_mask.any():
-            invalid_transactions = self.df[invalid_category_mask]
-            for idx, row in invalid_transactions.iterrows():
-                ai_category = self.ai_helper.guess_category_openai(
-                    row['merchant_name'], 
-                    list(self._category_cache.keys())
-                )
-                if ai_category != 'Other':
-                    self.df.loc[idx, 'category'] = ai_category
-
-        # Select and reorder columns
-        self.df = self.df[[
-            'transaction_date',
-            'amount',
-            'merchant_name',
-            'category',
-            'person'
-        ]]
+            # One classification per distinct merchant, written back in a single assignment
+            invalid_merchants = self.df.loc[invalid_category_mask, 'merchant_name']
+            ai_categories = self.ai_helper.guess_categories_batch(
+                invalid_merchants.unique().tolist(),
+                valid_categories
+            )
+            guesses = invalid_merchants.map(ai_categories)
+            guesses = guesses[guesses != 'Other']
+            self.df.loc[guesses.index, 'category'] = guesses
 
         return self.df
 
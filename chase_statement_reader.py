@@ -2,28 +2,33 @@ from pdf_statement_reader import PDFStatementReader
 import pandas as pd
 from datetime import datetime
 import re
-import pdfplumber
+
+# A transaction line: MM/DD date, description, then an amount such as 1,234.56 or -$5.00.
+# [ \t] rather than \s so a match never runs across lines.
+_TRANSACTION_LINE_RE = re.compile(
+    r'^[ \t]*(\d{2}/\d{2})[ \t]+(.+?)[ \t]+([-$\d,]*\d\.\d{2})[ \t]*$',
+    re.MULTILINE
+)
+_HEADER_RE = re.compile(r'ACCOUNT ACTIVITY|Date of')
+_AMOUNT_RE = re.compile(r'^-?\d+\.\d{2}$')
+# Statement period such as "Opening/Closing Date 11/16/25 - 12/15/25"
+# or "Statement Period: 11/16/2025 - 12/15/2025"
+_STATEMENT_PERIOD_RE = re.compile(r'(\d{1,2}/\d{1,2}/(\d{2}|\d{4}))\s*-\s*(\d{1,2}/\d{1,2}/(\d{2}|\d{4}))')
 
 class ChaseStatementReader(PDFStatementReader):
     """Chase bank statement reader"""
     
     def identify_bank(self) -> bool:
         """Check if this is a Chase statement"""
-        with pdfplumber.open(self.pdf_path) as pdf:
-            first_page = pdf.pages[0]
-            text = first_page.extract_text().lower()
-            return 'chase' in text
-            
-    def extract_statement_year(self, pdf) -> int:
+        return 'chase' in self.first_page_text.lower()
+
+    def extract_statement_year(self) -> int:
         """Extract the statement year from the PDF"""
         try:
-            first_page = pdf.pages[0]
-            text = first_page.extract_text()
+            text = self.first_page_text
 
-            # Look for statement period patterns like "Opening/Closing Date 11/16/25 - 12/15/25"
-            # or "Statement Period: 11/16/2025 - 12/15/2025"
-            closing_date_pattern = r'(\d{1,2}/\d{1,2}/(\d{2}|\d{4}))\s*-\s*(\d{1,2}/\d{1,2}/(\d{2}|\d{4}))'
-            match = re.search(closing_date_pattern, text)
+            # Look for the statement period; the closing date is the second date
+            match = _STATEMENT_PERIOD_RE.search(text)
 
             if match:
                 # Get the closing date (second date in range)
@@ -46,56 +51,41 @@ class ChaseStatementReader(PDFStatementReader):
 
     def extract_transactions(self) -> pd.DataFrame:
         """Extract transactions from Chase PDF statement"""
-        transactions = []
-
-        with pdfplumber.open(self.pdf_path) as pdf:
-            # Extract the statement year first
-            statement_year = self.extract_statement_year(pdf)
-            print(f"Using statement year: {statement_year}")
-
-            for page in pdf.pages:
-                text = page.extract_text()
-                
-                # Look for lines that start with a date (MM/DD) followed by text and amount
-                for line in text.split('\n'):
-                    try:
-                        # Skip empty lines or headers
-                        if not line.strip() or 'ACCOUNT ACTIVITY' in line or 'Date of' in line:
-                            continue
-                            
-                        # Try to match the date pattern at the start of the line
-                        if re.match(r'^\d{2}/\d{2}', line.strip()):
-                            # Split the line into parts
-                            parts = line.strip().split()
-                            if len(parts) >= 3:  # Need at least date, description, and amount
-                                date = parts[0]
-                                
-                                # The amount is usually the last part
-                                amount = parts[-1].replace('$', '').replace(',', '')
-                                
-                                # Everything in between is the description
-                                description = ' '.join(parts[1:-1])
-                                
-                                # Validate amount format
-                                if re.match(r'^-?\d+\.\d{2}$', amount):
-                                    # Add statement year to the date
-                                    date = f"{date}/{statement_year}"
-
-                                    transactions.append({
-                                        'date': self._standardize_date(date),
-                                        'description': description,
-                                        'amount': float(amount),
-                                        'bank': 'Chase'
-                                    })
-                    except Exception as e:
-                        print(f"Error processing line: {line}, Error: {e}")
-                        continue
-        
-        df = pd.DataFrame(transactions)
-        if not df.empty:
-            # Sort by date
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
-            df['date'] = df['date'].dt.strftime('%Y-%m-%d')
-        
-        return df 
\ No newline at end of file
+        # One list per column, so the DataFrame is built without per-row dicts
+        dates, descriptions, amounts = [], [], []
+
+        # Extract the statement year first
+        statement_year = self.extract_statement_year()
+        print(f"Using statement year: {statement_year}")
+
+        for page_number, page in enumerate(self._open_pdf().pages):
+            # The first page was already extracted by identify_bank/extract_statement_year
+            text = self.first_page_text if page_number == 0 else page.extract_text() or ''
+
+            # Lines that start with a date (MM/DD) followed by a description and an amount
+            for match in _TRANSACTION_LINE_RE.finditer(text):
+                # Skip headers
+                if _HEADER_RE.search(match.group(0)):
+                    continue
+
+                date, description, amount = match.groups()
+                amount = amount.replace('$', '').replace(',', '')
+
+                # Validate amount format
+                if _AMOUNT_RE.match(amount):
+                    # Add statement year to the date
+                    dates.append(f"{date}/{statement_year}")
+                    descriptions.append(' '.join(description.split()))
+                    amounts.append(float(amount))
+
+        if not dates:
+            return pd.DataFrame()
+
+        # Parse all dates at once and sort by date; dates stay datetime64
+        df = pd.DataFrame({
+            'date': pd.to_datetime(dates, format='%m/%d/%Y', errors='coerce'),
+            'description': descriptions,
+            'amount': amounts,
+            'bank': 'Chase'
+        })
+        return df.sort_values('date', kind='mergesort')
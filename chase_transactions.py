@@ -3,9 +3,24 @@ import pandas as pd
 from typing import List
 from chase_statement_reader import ChaseStatementReader
 from pdf_statement_reader import read_statement
-from ai_helper import AIHelper
+from concurrent.futures import ProcessPoolExecutor
 import os
 
+
+def _read_chase_statement(file_path: str) -> pd.DataFrame:
+    """
+    Extract the transactions from a single Chase Card PDF statement.
+    Module-level so it can run in a worker process.
+    """
+    print(f"Processing {os.path.basename(file_path)}...")
+    df = read_statement(file_path, ChaseStatementReader)
+    if not df.empty:
+        print(f"Successfully extracted {len(df)} transactions from {os.path.basename(file_path)}")
+    else:
+        print(f"No transactions found in {os.path.basename(file_path)}")
+    return df
+
+
 class ChaseTransactions(AddTransactions):
     """
     Implementation of AddTransactions for Chase Card transactions.
@@ -21,7 +36,6 @@ class ChaseTransactions(AddTransactions):
         """
         super().__init__(db_config, person)
         self.account_type = 'Chase Card'
-        self.ai_helper = AIHelper()
 
     def read_files(self, file_paths: List[str]) -> pd.DataFrame:
         """
@@ -31,21 +45,12 @@ class ChaseTransactions(AddTransactions):
         Returns:
             pd.DataFrame: Combined DataFrame of all transactions
         """
-        all_transactions = []
-        for file_path in file_paths:
-            try:
-                print(f"Processing {os.path.basename(file_path)}...")
-                df = read_statement(file_path, ChaseStatementReader)
-                if not df.empty:
-                    all_transactions.append(df)
-                    print(f"Successfully extracted {len(df)} transactions from {os.path.basename(file_path)}")
-                else:
-                    print(f"No transactions found in {os.path.basename(file_path)}")
-            except Exception as e:
-                print(f"Error processing {os.path.basename(file_path)}: {e}")
-                if file_path in self.processed_files:
-                    self.processed_files.remove(file_path)
-        
+        # PDF parsing is CPU-bound pure Python, so statements are parsed in separate processes
+        all_transactions = [
+            df for df in self._read_files_parallel(file_paths, _read_chase_statement, ProcessPoolExecutor)
+            if not df.empty
+        ]
+
         if not all_transactions:
             raise ValueError("No valid files were read")
         
@@ -59,12 +64,12 @@ class ChaseTransactions(AddTransactions):
         })
         
         
-        # Remove any duplicates based on date, description, and amount
-        combined_df = combined_df.drop_duplicates(subset=['transaction_date', 'merchant_name', 'amount'])
-        
-        # Reset index after concatenation and deduplication
-        combined_df.reset_index(drop=True, inplace=True)
-        
+        # Remove any duplicates based on date, description, and amount, renumbering the index
+        combined_df = combined_df.drop_duplicates(
+            subset=['transaction_date', 'merchant_name', 'amount'],
+            ignore_index=True
+        )
+
         self.df = combined_df
         return self.df
 
@@ -80,23 +85,16 @@ class ChaseTransactions(AddTransactions):
         if self.df is None:
             raise ValueError("No data to clean. Call read_files first.")
         
-        # Convert date string to datetime (Chase PDF reader outputs YYYY-MM-DD format)
-        self.df['transaction_date'] = pd.to_datetime(self.df['transaction_date'], format='%Y-%m-%d')
-        
-        # Ensure amount is numeric and handle credits/debits
-        self.df['amount'] = pd.to_numeric(self.df['amount'])
+        # Build the standard columns in one step: select
+        # (Chase PDF reader already outputs datetime64 dates)
+        self.df = pd.DataFrame({
+            'transaction_date': self.df['transaction_date'],
+            'amount': self.df['amount'],  # float64 from the statement reader
+            'merchant_name': self.df['merchant_name']
+        })
 
-        # Add categories using AI helper
+        # Add categories using AI helper (appended as the last column)
         self.df = self.ai_helper.add_category(self.df, self._category_cache)
 
-
-        # Select and reorder columns
-        self.df = self.df[[
-            'transaction_date',
-            'amount',
-            'merchant_name',
-            'category'
-        ]]
-        
         return self.df
 
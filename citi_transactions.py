@@ -1,7 +1,6 @@
 from add_transactions import AddTransactions
 import pandas as pd
 from typing import List
-from ai_helper import AIHelper
 
 class CitiTransactions(AddTransactions):
     def __init__(self, db_config: dict, person: str):
@@ -14,7 +13,6 @@ class CitiTransactions(AddTransactions):
         """
         super().__init__(db_config, person)
         self.account_type = 'Citi Card'
-        self.ai_helper = AIHelper()
 
     def read_files(self, file_paths: List[str]) -> pd.DataFrame:
         """
@@ -26,22 +24,23 @@ class CitiTransactions(AddTransactions):
         Returns:
             pd.DataFrame: Combined DataFrame of all transactions
         """
-        dataframes = []
-        for file_path in file_paths:
-            try:
-                df = pd.read_csv(file_path)
-                dataframes.append(df)
-            except Exception as e:
-                print(f"Error reading file {file_path}: {str(e)}")
-                if file_path in self.processed_files:
-                    self.processed_files.remove(file_path)
-        
+        dataframes = self._read_files_parallel(file_paths, self._read_file)
+
         if not dataframes:
             raise ValueError("No valid files were read")
         
         self.df = pd.concat(dataframes, ignore_index=True)
         return self.df
 
+    def _read_file(self, file_path: str) -> pd.DataFrame:
+        """Read a single Citi Card CSV file, parsing only the columns clean_data uses."""
+        # Credit is optional, so select columns by name rather than with a fixed list
+        return pd.read_csv(
+            file_path,
+            usecols=lambda column: column in {'Date', 'Description', 'Debit', 'Credit'},
+            dtype={'Description': str, 'Debit': 'float64', 'Credit': 'float64'}
+        )
+
     def clean_data(self) -> pd.DataFrame:
         """
         Clean and standardize the Citi Card transaction data.
@@ -56,44 +55,36 @@ class CitiTransactions(AddTransactions):
         if self.df is None:
             raise ValueError("No data to clean. Call read_files first.")
 
-        # Rename columns to standard format
-        self.df = self.df.rename(columns={
-            'Date': 'transaction_date',
-            'Description': 'merchant_name',
-            'Debit': 'amount'
-        })
-
         #merge credit and debit into amount
+        amount = self.df['Debit']
         if 'Credit' in self.df.columns:
-            self.df['amount'] = self.df['amount'].fillna(0) + self.df['Credit'].fillna(0)
-            self.df.drop(columns=['Credit'], inplace=True)
+            amount = amount.fillna(0) + self.df['Credit'].fillna(0)
 
 
-        # Convert date string to datetime with flexible format handling
-        def parse_date(date_str):
-            formats = ['%m/%d/%Y', '%b %d, %Y', '%Y-%m-%d']
-            for fmt in formats:
-                try:
-                    return pd.to_datetime(date_str, format=fmt)
-                except ValueError:
-                    continue
-            return pd.to_datetime(date_str)  # fallback to pandas default parsing
-        
-        self.df['transaction_date'] = self.df['transaction_date'].apply(parse_date)
+        # Convert date strings to datetime with flexible format handling:
+        # each known format is tried over the whole column, only on rows still unparsed
+        dates = self.df['Date']
+        transaction_date = pd.to_datetime(dates, format='%m/%d/%Y', errors='coerce')
+        for fmt in ['%b %d, %Y', '%Y-%m-%d']:
+            unparsed = transaction_date.isna() & dates.notna()
+            if not unparsed.any():
+                break
+            transaction_date = transaction_date.fillna(pd.to_datetime(dates[unparsed], format=fmt, errors='coerce'))
 
-        # Ensure amount is numeric and handle credits/debits
-        self.df['amount'] = pd.to_numeric(self.df['amount'])
+        # Fallback to pandas default parsing for anything left
+        unparsed = transaction_date.isna() & dates.notna()
+        if unparsed.any():
+            transaction_date = transaction_date.fillna(pd.to_datetime(dates[unparsed], format='mixed'))
 
-        # Add categories using AI helper
-        self.df = self.ai_helper.add_category(self.df, self._category_cache)
+        # Build the standard columns in one step: rename, convert and select
+        self.df = pd.DataFrame({
+            'transaction_date': transaction_date,
+            'amount': amount,  # Debit/Credit are read as float64
+            'merchant_name': self.df['Description']
+        })
 
-        # Select and reorder columns
-        self.df = self.df[[
-            'transaction_date',
-            'amount',
-            'merchant_name',
-            'category'
-        ]]
+        # Add categories using AI helper (appended as the last column)
+        self.df = self.ai_helper.add_category(self.df, self._category_cache)
 
         return self.df
 
@@ -7,6 +7,7 @@ This handles cases where date parsing incorrectly assigned future years to trans
 import psycopg2
 import pandas as pd
 from datetime import date
+import io
 import os
 from dotenv import load_dotenv
 
@@ -40,7 +41,12 @@ def get_future_transactions():
         ORDER BY transaction_date DESC
         """
         
-        df = pd.read_sql(query, conn)
+        # Stream the result as CSV through COPY instead of fetching row by row
+        buffer = io.StringIO()
+        with conn.cursor() as cursor:
+            cursor.copy_expert(f"COPY ({query.strip()}) TO STDOUT WITH CSV HEADER", buffer)
+        buffer.seek(0)
+        df = pd.read_csv(buffer, parse_dates=['transaction_date'])
         return df
     
     finally:
@@ -56,36 +62,33 @@ def fix_transaction_dates(transactions_df):
     Returns:
         pd.DataFrame: DataFrame with corrected dates
     """
-    corrected_transactions = transactions_df.copy()
-    
     # Convert transaction_date to datetime if it's not already
-    corrected_transactions['transaction_date'] = pd.to_datetime(corrected_transactions['transaction_date'])
+    transaction_dates = pd.to_datetime(transactions_df['transaction_date'])
     
-    # Filter for 2025 transactions and convert to 2024
-    mask_2025 = corrected_transactions['transaction_date'].dt.year == 2025
+    # Filter for 2025 transactions; only those rows are copied and converted to 2024
+    mask_2025 = transaction_dates.dt.year == 2025
+    corrected_transactions = transactions_df[mask_2025].copy()
     
     if mask_2025.any():
         print(f"Found {mask_2025.sum()} transactions with year 2025 to correct")
         
-        # Create new dates with year 2024
-        corrected_transactions.loc[mask_2025, 'transaction_date'] = (
-            corrected_transactions.loc[mask_2025, 'transaction_date'].apply(
-                lambda x: x.replace(year=2024)
-            )
-        )
+        # Create new dates with year 2024 (one vectorized shift, no per-row replace)
+        corrected_transactions['transaction_date'] = transaction_dates[mask_2025] - pd.DateOffset(years=1)
         
         # Show what we're about to change
         print("\nTransactions to be corrected:")
-        print(corrected_transactions[mask_2025][['id', 'transaction_date', 'merchant_name', 'amount']])
+        print(corrected_transactions[['id', 'transaction_date', 'merchant_name', 'amount']])
         
     else:
         print("No transactions with year 2025 found")
     
-    return corrected_transactions[mask_2025]  # Return only the corrected ones
+    return corrected_transactions  # Only the corrected ones
 
 def update_transactions_in_db(corrected_transactions):
     """
     Update the corrected transactions back to the database.
+    The year is shifted server-side in a single UPDATE over the corrected ids;
+    only rows still dated 2025 are shifted, so re-running it is harmless.
     
     Args:
         corrected_transactions (pd.DataFrame): DataFrame with corrected transaction dates
@@ -101,18 +104,13 @@ def update_transactions_in_db(corrected_transactions):
         
         update_query = """
         UPDATE transactions 
-        SET transaction_date = %s 
-        WHERE id = %s
+        SET transaction_date = transaction_date - INTERVAL '1 year'
+        WHERE id = ANY(%s)
+          AND EXTRACT(YEAR FROM transaction_date) = 2025
         """
         
-        # Prepare update data
-        update_data = [
-            (row['transaction_date'].strftime('%Y-%m-%d %H:%M:%S'), row['id'])
-            for _, row in corrected_transactions.iterrows()
-        ]
-        
-        # Execute batch update
-        cursor.executemany(update_query, update_data)
+        # One set-based statement for every corrected transaction
+        cursor.execute(update_query, (corrected_transactions['id'].tolist(),))
         
         print(f"\nUpdated {cursor.rowcount} transactions in the database")
         
@@ -6,6 +6,7 @@ the appropriate category, and updates the database.
 """
 
 import psycopg2
+from psycopg2.extras import execute_values
 import os
 import sys
 import traceback
@@ -31,16 +32,15 @@ def get_db_config():
         'port': os.getenv('DB_PORT', '5432')
     }
 
-def get_categories_from_db(conn):
+def get_categories_from_db(cursor):
     """Fetch all available categories from the database."""
-    cursor = conn.cursor()
     cursor.execute("SELECT id, category_name FROM budget_app.spending_categories")
     categories = cursor.fetchall()
     category_names = [name for id, name in categories]
     category_map = {name: id for id, name in categories}
     return category_names, category_map
 
-def get_transactions_to_update(conn, target_categories=None):
+def get_transactions_to_update(cursor, target_categories=None):
     """
     Get transactions that need category updates.
 
@@ -49,21 +49,24 @@ def get_transactions_to_update(conn, target_categories=None):
                                                If None, targets transactions with null category_id.
                                                Can be a string for single category or list for multiple.
     """
-    cursor = conn.cursor()
-
-
-    # Build IN clause with placeholders
-
-    placeholders = "'"+"','".join(target_categories)+"'"
-    query = """
-        SELECT transaction_id, merchant_name, spending_category
-        FROM budget_app.transactions_view tv
-        WHERE tv.spending_category IN ({})
-    """.format(placeholders)
-    print(query)
-    cursor.execute(query)
-
-    print(f"Finding transactions with categories {target_categories}...")
+    if target_categories is None:
+        # transactions_view inner-joins categories, so uncategorized rows come from the table
+        print("Finding transactions without a category...")
+        cursor.execute("""
+            SELECT id, merchant_name, NULL
+            FROM budget_app.transactions
+            WHERE category_id IS NULL
+        """)
+    else:
+        if isinstance(target_categories, str):
+            target_categories = [target_categories]
+        print(f"Finding transactions with categories {target_categories}...")
+        # Categories are passed as one array parameter, never interpolated into the SQL
+        cursor.execute("""
+            SELECT transaction_id, merchant_name, spending_category
+            FROM budget_app.transactions_view tv
+            WHERE tv.spending_category = ANY(%s)
+        """, (list(target_categories),))
 
     results = cursor.fetchall()
     if not results:
@@ -72,14 +75,21 @@ def get_transactions_to_update(conn, target_categories=None):
 
     return results
 
-def update_transaction_category(conn, transaction_id, category_id):
-    """Update a transaction's category_id."""
-    cursor = conn.cursor()
-    cursor.execute("""
-        UPDATE budget_app.transactions 
-        SET category_id = %s 
-        WHERE id = %s
-    """, (category_id, transaction_id))
+def update_transaction_categories(cursor, updates):
+    """
+    Update many transactions' category_id in a single statement.
+
+    Args:
+        updates (list): (category_id, transaction_id) pairs
+    """
+    if not updates:
+        return
+    execute_values(cursor, """
+        UPDATE budget_app.transactions AS t
+        SET category_id = v.category_id
+        FROM (VALUES %s) AS v(category_id, transaction_id)
+        WHERE t.id = v.transaction_id
+    """, updates, page_size=500)
 
 def main(target_category):
     """Main function to fix missing category IDs."""
@@ -100,12 +110,15 @@ def main(target_category):
         return
     
     try:
+        # One cursor for every query and update in this run
+        cursor = conn.cursor()
+
         # Get available categories
-        category_names, category_map = get_categories_from_db(conn)
+        category_names, category_map = get_categories_from_db(cursor)
         print(f"Found {len(category_names)} categories: {', '.join(category_names)}")
         
         # Get transactions to update
-        transactions = get_transactions_to_update(conn, target_category)
+        transactions = get_transactions_to_update(cursor, target_category)
         print(f"Found {len(transactions)} transactions to update")
         
         if not transactions:
@@ -119,8 +132,22 @@ def main(target_category):
                 print("Operation cancelled.")
                 return
         
-        # Process each transaction
-        updated_count = 0
+        # Resolve vendor mapping once per distinct merchant; merchant_name is
+        # nullable, and blank names have nothing to classify
+        vendor_categories = {
+            merchant_name: get_category_from_vendor(merchant_name)
+            for merchant_name in {merchant_name for _, merchant_name, _ in transactions if merchant_name}
+        }
+
+        # Classify merchants unknown to vendor mapping in batched AI requests, once per merchant.
+        # Re-asking the model is the point of this script, so cached answers are bypassed.
+        unknown_merchants = sorted(
+            merchant_name for merchant_name, category in vendor_categories.items() if not category
+        )
+        ai_categories = ai_helper.guess_categories_batch(unknown_merchants, category_names, use_cache=False)
+
+        # Process each transaction, collecting (category_id, transaction_id) updates
+        updates = []
         vendor_map_count = 0
         ai_count = 0
         for transaction_id, merchant_name, old_category in transactions:
@@ -129,15 +156,18 @@ def main(target_category):
             print(f"  Current category: {old_category_str}")
 
             # First, try vendor mapping for known vendors
-            vendor_category = get_category_from_vendor(merchant_name)
+            vendor_category = vendor_categories.get(merchant_name)
 
-            if vendor_category:
+            if not merchant_name:
+                category_name = "Other"
+                source = "no merchant name"
+            elif vendor_category:
                 category_name = vendor_category
                 source = "vendor mapping"
                 vendor_map_count += 1
             else:
                 # Fall back to AI for unknown merchants
-                category_name = ai_helper.guess_category_openai(merchant_name, category_names)
+                category_name = ai_categories[merchant_name]
                 source = "OpenAI"
                 if category_name != "Other":
                     ai_count += 1
@@ -152,17 +182,17 @@ def main(target_category):
 
                 # Only update if the category is different from the old one
                 if canonical_name != old_category:
-                    update_transaction_category(conn, transaction_id, category_id)
-                    updated_count += 1
+                    updates.append((category_id, transaction_id))
                     print(f"  -> Updated from '{old_category_str}' to '{canonical_name}' (ID: {category_id}) [{source}]")
                 else:
                     print(f"  -> Category already set to '{canonical_name}', no update needed")
             else:
                 print(f"  -> Warning: Category '{category_name}' not found in database, skipping")
         
-        # Commit all changes
+        # Write all updates in one round trip, then commit
+        update_transaction_categories(cursor, updates)
         conn.commit()
-        print(f"\nSuccessfully updated {updated_count} transactions with category IDs")
+        print(f"\nSuccessfully updated {len(updates)} transactions with category IDs")
         print(f"  - From vendor mapping: {vendor_map_count}")
         print(f"  - From OpenAI: {ai_count}")
         
@@ -176,5 +206,6 @@ def main(target_category):
         print("Database connection closed.")
 
 if __name__ == "__main__":
-    CategoryList = ["Entertainment"]
-    main(CategoryList)
\ No newline at end of file
+    # Category names to recategorize come from the command line;
+    # with none, transactions without a category are fixed
+    main(sys.argv[1:] or None)
\ No newline at end of file
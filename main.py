@@ -2,7 +2,9 @@ from apple_transactions import AppleTransactions
 from chase_transactions import ChaseTransactions
 from amex_transactions import AmexTransactions
 from citi_transactions import CitiTransactions
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import glob
+import logging
 import os
 import sys
 import psycopg2
@@ -11,6 +13,9 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Processors report progress through logging; print it like the rest of the output
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
 # Database configuration
 DB_CONFIG = {
     "dbname": os.environ.get("DB_NAME", "money_stuff"),
@@ -71,19 +76,38 @@ def main():
         }
     ]
 
+    # Build the processors up front, in this thread (the shared AIHelper is created here)
+    jobs = []
     for processor_info in processors:
         try:
             processor = processor_info["class"](db_config=DB_CONFIG, person=processor_info["person"])
             files = glob.glob(processor_info["files_glob"])
             
             if files:
-                processor.process_transactions(files)
-                print(f"Successfully processed {processor_info['name']} transactions")
+                jobs.append((processor, files, processor_info))
             else:
                 print(f"No {processor_info['name']} transaction files found")
         
         except Exception as e:
             print(f"An error occurred while processing {processor_info['name']} transactions: {str(e)}")
 
+    if not jobs:
+        return
+
+    # Each card's files are independent, so the processors run concurrently;
+    # their database writes are serialized inside add_to_database
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {
+            executor.submit(processor.process_transactions, files): processor_info
+            for processor, files, processor_info in jobs
+        }
+        for future in as_completed(futures):
+            processor_info = futures[future]
+            try:
+                future.result()
+                print(f"Successfully processed {processor_info['name']} transactions")
+            except Exception as e:
+                print(f"An error occurred while processing {processor_info['name']} transactions: {str(e)}")
+
 if __name__ == "__main__":
     main()
@@ -7,10 +7,35 @@ from datetime import datetime
 
 class PDFStatementReader(ABC):
     """Abstract base class for reading bank statements"""
+
+    # Currency symbols/commas, and "(12.00)" style negatives, used by _standardize_amount
+    _AMOUNT_STRIP_RE = re.compile(r'[$,]')
+    _PARENS_RE = re.compile(r'^\((.*)\)$')
     
     def __init__(self, pdf_path: str):
         self.pdf_path = pdf_path
-        
+        self._pdf = None
+        self._first_page_text = None
+
+    def _open_pdf(self):
+        """Open the PDF on first use and reuse it for every later read"""
+        if self._pdf is None:
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return self._pdf
+
+    @property
+    def first_page_text(self) -> str:
+        """Text of the first page, extracted once"""
+        if self._first_page_text is None:
+            self._first_page_text = self._open_pdf().pages[0].extract_text() or ''
+        return self._first_page_text
+
+    def close(self) -> None:
+        """Close the PDF if it was opened"""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
     @abstractmethod
     def identify_bank(self) -> bool:
         """Check if the PDF matches this bank's format"""
@@ -43,10 +68,9 @@ class PDFStatementReader(ABC):
             if not isinstance(amount_str, str) or amount_str.lower() == 'nan':
                 return None
             # Remove currency symbols and commas
-            amount_str = re.sub(r'[$,]', '', amount_str.strip())
+            amount_str = self._AMOUNT_STRIP_RE.sub('', amount_str.strip())
             # Handle parentheses for negative numbers
-            if amount_str.startswith('(') and amount_str.endswith(')'):
-                amount_str = '-' + amount_str[1:-1]
+            amount_str = self._PARENS_RE.sub(r'-\1', amount_str)
             return float(amount_str)
         except Exception as e:
             print(f"Error standardizing amount {amount_str}: {e}")
@@ -65,10 +89,13 @@ def read_statement(pdf_path: str, reader_class) -> pd.DataFrame:
     """
     try:
         reader = reader_class(pdf_path)
-        if reader.identify_bank():
-            return reader.extract_transactions()
-        else:
-            raise ValueError(f"PDF not recognized as valid format for {reader_class.__name__}")
+        try:
+            if reader.identify_bank():
+                return reader.extract_transactions()
+            else:
+                raise ValueError(f"PDF not recognized as valid format for {reader_class.__name__}")
+        finally:
+            reader.close()
     except Exception as e:
         print(f"Error reading statement: {e}")
         return pd.DataFrame() 
\ No newline at end of file
@@ -5,10 +5,13 @@ This module contains a mapping of known vendor names to their spending categorie
 This allows for quick categorization without needing to call the OpenAI API.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 # Dictionary mapping vendor name patterns to categories
 # Keys are lowercase patterns to match against merchant names
 # Values must match EXACTLY with category_name in database.sql
-VENDOR_CATEGORY_MAP = {
+_RAW_VENDOR_MAP = {
     # Hobby
     "global bike": "Hobby",
     "MBO": "Hobby",
@@ -130,7 +133,22 @@ VENDOR_CATEGORY_MAP = {
 }
 
 # Normalize keys and values to lowercase for consistent matching
-VENDOR_CATEGORY_MAP = {k.lower(): v.lower() for k, v in VENDOR_CATEGORY_MAP.items()}
+_RAW_VENDOR_MAP = {k.lower(): v.lower() for k, v in _RAW_VENDOR_MAP.items()}
+
+# Read-only view; add new entries with add_vendor_mapping so the lookup index stays in sync
+VENDOR_CATEGORY_MAP = MappingProxyType(_RAW_VENDOR_MAP)
+
+
+def _rebuild_index() -> None:
+    """
+    Snapshot VENDOR_CATEGORY_MAP as lowercased (pattern, category) pairs in dict
+    order, so lookups do no per-pattern lowercasing. Dict order is the match
+    priority: the first listed pattern found in a merchant name wins.
+    """
+    global _VENDOR_PATTERNS
+    _VENDOR_PATTERNS = tuple(
+        (vendor.lower(), category.lower()) for vendor, category in VENDOR_CATEGORY_MAP.items()
+    )
 
 
 def get_category_from_vendor(merchant_name: str) -> str:
@@ -143,17 +161,26 @@ def get_category_from_vendor(merchant_name: str) -> str:
     Returns:
         str: The category name if found, None otherwise
     """
+    if not merchant_name or not isinstance(merchant_name, str):
+        return None
+    return _lookup_category_cached(merchant_name.lower())
 
-    merchant_lower = merchant_name.lower()
 
+@lru_cache(maxsize=4096)
+def _lookup_category_cached(merchant_lower: str) -> str:
+    """
+    Match a lowercased merchant name against known vendors.
+    Cached per name, so "AMAZON" and "Amazon" share one entry;
+    add_vendor_mapping clears the cache.
+    """
     # Check for exact matches first
     if merchant_lower in VENDOR_CATEGORY_MAP:
         return VENDOR_CATEGORY_MAP[merchant_lower].lower()
 
     # Check for partial matches (substring matching)
-    for vendor_pattern, category in VENDOR_CATEGORY_MAP.items():
-        if vendor_pattern.lower() in merchant_lower:
-            return category.lower()
+    for vendor_pattern, category in _VENDOR_PATTERNS:
+        if vendor_pattern in merchant_lower:
+            return category
 
     return None
 
@@ -166,4 +193,9 @@ def add_vendor_mapping(vendor_name: str, category: str) -> None:
         vendor_name (str): The vendor name pattern (will be lowercased)
         category (str): The category to assign to this vendor
     """
-    VENDOR_CATEGORY_MAP[vendor_name.lower()] = category
+    _RAW_VENDOR_MAP[vendor_name.lower()] = category
+    _rebuild_index()
+    _lookup_category_cached.cache_clear()
+
+
+_rebuild_index()